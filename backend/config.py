@@ -14,6 +14,13 @@ class Settings(BaseSettings):
     # File storage
     UPLOAD_DIR: str = "./uploads"
     PROCESSED_DIR: str = "./processed"
+    ARCHIVE_DIR: str = "./archive"  # Local object-store stand-in for originals
+    OFFLOAD_ORIGINALS: bool = True
+    
+    # Retention (days, 0 keeps artifacts forever)
+    PROCESSED_RETENTION_DAYS: int = 7
+    ORIGINAL_RETENTION_DAYS: int = 30
+    RETENTION_SWEEP_INTERVAL: int = 3600  # seconds
     
     # OCR settings
     TESSERACT_CMD: str = "tesseract"
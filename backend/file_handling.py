@@ -0,0 +1,73 @@
+import hashlib
+import os
+import shutil
+import threading
+import cv2
+from app.core.config import settings
+
+class LocalObjectStore:
+    """Content-addressed file store standing in for an external object store"""
+    
+    def __init__(self, root: str):
+        self.root = root
+        # Serialises dedup in put() against retention deletes
+        self.lock = threading.Lock()
+    
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+    
+    def put(self, file_path: str) -> str:
+        """Move a file into the store and return its object path"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        
+        key = digest.hexdigest() + os.path.splitext(file_path)[1].lower()
+        object_path = self.path_for(key)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        
+        with self.lock:
+            if os.path.exists(object_path):
+                # Identical upload already stored, drop the duplicate
+                os.remove(file_path)
+            else:
+                shutil.move(file_path, object_path)
+            # Mark the object as recently used so retention leaves it alone
+            os.utime(object_path)
+        return object_path
+    
+    def delete_if_untouched(self, path: str, since: float) -> bool:
+        """Delete an object unless it was stored or reused after `since`"""
+        with self.lock:
+            if not os.path.exists(path) or os.path.getmtime(path) >= since:
+                return False
+            os.remove(path)
+            return True
+
+object_store = LocalObjectStore(settings.ARCHIVE_DIR)
+
+def save_processed_image(image, source_path: str) -> str:
+    """Write a thresholded page as a 1-bit PNG and return its path"""
+    os.makedirs(settings.PROCESSED_DIR, exist_ok=True)
+    
+    # Always store as PNG: bilevel output is a fraction of an 8-bit copy
+    base_name = os.path.splitext(os.path.basename(source_path))[0]
+    processed_path = os.path.join(settings.PROCESSED_DIR, f"preprocessed_{base_name}.png")
+    
+    if not cv2.imwrite(processed_path, image, [cv2.IMWRITE_PNG_BILEVEL, 1]):
+        raise ValueError(f"Could not write processed image to {processed_path}")
+    return processed_path
+
+def offload_original(file_path: str) -> str:
+    """Move an uploaded original into the archive store if enabled"""
+    if not settings.OFFLOAD_ORIGINALS:
+        return file_path
+    return object_store.put(file_path)
+
+def delete_file(path: str) -> bool:
+    """Remove a stored artifact, returning whether anything was deleted"""
+    if not path or not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
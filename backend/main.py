@@ -1,9 +1,11 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import upload, processing, results
 from app.core.config import settings
 from app.db.base import Base
 from app.db.session import engine
+from app.services.rpa.scheduler import run_retention_sweeper
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -28,6 +30,18 @@ app.include_router(upload.router, prefix="/api", tags=["upload"])
 app.include_router(processing.router, prefix="/api", tags=["processing"])
 app.include_router(results.router, prefix="/api", tags=["results"])
 
+@app.on_event("startup")
+async def start_retention_sweeper():
+    app.state.retention_sweeper = asyncio.create_task(run_retention_sweeper())
+
+@app.on_event("shutdown")
+async def stop_retention_sweeper():
+    app.state.retention_sweeper.cancel()
+    try:
+        await app.state.retention_sweeper
+    except asyncio.CancelledError:
+        pass
+
 @app.get("/api/health", tags=["health"])
 async def health_check():
     return {"status": "ok"}
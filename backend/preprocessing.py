@@ -1,9 +1,8 @@
 import cv2
 import numpy as np
-import os
 from sqlalchemy.orm import Session
 from app.db.models.survey import Survey
-from app.core.config import settings
+from app.utils.file_handling import save_processed_image, offload_original
 from app.services.ocr.bubble_detection import detect_bubbles
 
 async def preprocess_image(file_path: str, survey_id: int, db: Session):
@@ -29,16 +28,15 @@ async def preprocess_image(file_path: str, survey_id: int, db: Session):
             cv2.THRESH_BINARY_INV, 11, 2
         )
         
-        # Create processed directory if it doesn't exist
-        os.makedirs(settings.PROCESSED_DIR, exist_ok=True)
+        # Save preprocessed image as a compact 1-bit PNG
+        processed_path = save_processed_image(thresh, file_path)
         
-        # Save preprocessed image
-        processed_filename = os.path.basename(file_path)
-        processed_path = os.path.join(settings.PROCESSED_DIR, f"preprocessed_{processed_filename}")
-        cv2.imwrite(processed_path, thresh)
+        # Later stages only read the processed image, so archive the original
+        original_path = offload_original(file_path)
         
         # Update survey record
         survey = db.query(Survey).filter(Survey.id == survey_id).first()
+        survey.original_path = original_path
         survey.processed_path = processed_path
         survey.progress = 30.0
         db.commit()
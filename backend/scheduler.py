@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.db.models.survey import Survey
+from app.db.session import SessionLocal
+from app.core.config import settings
+from app.utils.file_handling import delete_file, object_store
+
+logger = logging.getLogger(__name__)
+
+# Only artifacts of finished surveys are safe to remove
+FINISHED_STATUSES = ("completed", "failed")
+
+def sweep_expired_artifacts(db: Session, now: datetime = None):
+    """Delete processed images and originals past their retention period"""
+    now = now or datetime.now(timezone.utc)
+    removed = {"processed": 0, "originals": 0}
+    
+    if settings.PROCESSED_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=settings.PROCESSED_RETENTION_DAYS)
+        surveys = db.query(Survey).filter(
+            Survey.status.in_(FINISHED_STATUSES),
+            Survey.processed_path.isnot(None),
+            Survey.created_at < cutoff
+        ).all()
+        for survey in surveys:
+            if delete_file(survey.processed_path):
+                removed["processed"] += 1
+            survey.processed_path = None
+        db.commit()
+    
+    if settings.ORIGINAL_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=settings.ORIGINAL_RETENTION_DAYS)
+        surveys = db.query(Survey).filter(
+            Survey.status.in_(FINISHED_STATUSES),
+            Survey.created_at < cutoff
+        ).all()
+        
+        # Rows keep their path after a purge, skip those already gone
+        paths = {s.original_path for s in surveys if os.path.exists(s.original_path)}
+        
+        # Identical uploads share one archived object, keep it while any
+        # unfinished or still-retained survey refers to it
+        in_use = {
+            path for (path,) in db.query(Survey.original_path).filter(
+                Survey.original_path.in_(paths),
+                or_(
+                    Survey.status.notin_(FINISHED_STATUSES),
+                    Survey.created_at >= cutoff
+                )
+            ).distinct()
+        } if paths else set()
+        
+        # Objects reused by an upload after the cutoff survive even if the
+        # new survey row does not reference them yet
+        for path in paths - in_use:
+            if object_store.delete_if_untouched(path, cutoff.timestamp()):
+                removed["originals"] += 1
+    
+    return removed
+
+def sweep_once():
+    """Run one retention sweep with its own database session"""
+    db = SessionLocal()
+    try:
+        return sweep_expired_artifacts(db)
+    finally:
+        db.close()
+
+async def run_retention_sweeper():
+    """Periodically enforce retention policies in the background"""
+    while True:
+        try:
+            # Queries and file deletions are blocking, keep them off the event loop
+            removed = await asyncio.to_thread(sweep_once)
+            if any(removed.values()):
+                logger.info("Retention sweep removed %s", removed)
+        except Exception:
+            logger.exception("Retention sweep failed")
+        await asyncio.sleep(settings.RETENTION_SWEEP_INTERVAL)
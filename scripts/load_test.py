@@ -0,0 +1,238 @@
+"""Load test for the survey upload, status and results endpoints.
+
+Simulated clients each upload synthetic survey forms, poll the processing
+status until the survey finishes and then fetch its results.
+
+    python scripts/load_test.py --clients 20 --forms 5
+    python scripts/load_test.py --serve --app-dir backend --fake-ocr --clients 50
+
+With --serve the FastAPI app is started in-process, which also allows
+--fake-ocr to replace Tesseract with a deterministic stub so the numbers
+reflect the API and image pipeline rather than the OCR engine. The served
+app uses a temporary database and storage directories unless --data-dir
+is given.
+"""
+import argparse
+import asyncio
+import hashlib
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import cv2
+import httpx
+import numpy as np
+
+QUESTIONS = [
+    ("1. How would you rate our service?", ["Excellent", "Good", "Average", "Poor"]),
+    ("2. Would you recommend us to others?", ["Yes", "No", "Maybe"]),
+    ("3. How often do you use our product?", ["Daily", "Weekly", "Monthly", "Rarely"]),
+]
+
+
+def create_survey_form(rng):
+    """Draw a survey form with one random bubble filled per question"""
+    img = np.ones((800, 600, 3), np.uint8) * 255
+    cv2.putText(img, "Customer Satisfaction Survey", (100, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+
+    y_pos = 120
+    for question, options in QUESTIONS:
+        cv2.putText(img, question, (50, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1)
+        y_pos += 30
+        chosen = rng.randrange(len(options))
+        for i, option in enumerate(options):
+            cv2.circle(img, (70, y_pos), 10, (0, 0, 0), 1)
+            if i == chosen:
+                cv2.circle(img, (70, y_pos), 8, (0, 0, 0), -1)
+            cv2.putText(img, option, (100, y_pos + 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+            y_pos += 40
+        y_pos += 30
+
+    # Light noise so every upload is a distinct file
+    noise = rng.randrange(1 << 30)
+    noisy = np.random.default_rng(noise).integers(0, 12, img.shape, dtype=np.uint8)
+    ok, encoded = cv2.imencode(".png", cv2.subtract(img, noisy))
+    if not ok:
+        raise ValueError("Could not encode synthetic survey form")
+    return encoded.tobytes()
+
+
+def fake_image_to_string(image, *args, **kwargs):
+    """Deterministic stand-in for pytesseract.image_to_string"""
+    digest = hashlib.sha1(np.ascontiguousarray(image).tobytes()).hexdigest()
+    return f"Question {digest[:8]}"
+
+
+def start_server(host, port, fake_ocr, app_dir, data_dir):
+    """Run the API in a background thread and wait until it is healthy"""
+    # Keep the run's database and artifacts out of the developer's data
+    os.makedirs(data_dir, exist_ok=True)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(data_dir, 'load_test.db')}"
+    for name in ("UPLOAD_DIR", "PROCESSED_DIR", "ARCHIVE_DIR"):
+        os.environ[name] = os.path.join(data_dir, name.split("_")[0].lower())
+
+    sys.path.insert(0, app_dir)
+    import uvicorn
+    from app.main import app
+
+    if fake_ocr:
+        from app.services.ocr import text_extraction
+        text_extraction.pytesseract.image_to_string = fake_image_to_string
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://{host}:{port}/api/health").status_code == 200:
+                return server, thread
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("API server did not start")
+
+
+class Stats:
+    def __init__(self):
+        self.requests = defaultdict(int)
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+
+    async def timed(self, endpoint, request):
+        self.requests[endpoint] += 1
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of values"""
+    ordered = sorted(values)
+    index = math.ceil(pct / 100 * len(ordered)) - 1
+    return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+async def run_client(client, stats, forms, args):
+    for form in forms:
+        response = await stats.timed(
+            "upload",
+            client.post("/api/upload", files={"file": ("survey.png", form, "image/png")}),
+        )
+        if response is None or response.status_code != 200:
+            continue
+        survey_id = response.json()["id"]
+
+        status = None
+        deadline = time.monotonic() + args.timeout
+        while time.monotonic() < deadline:
+            response = await stats.timed("status", client.get(f"/api/status/{survey_id}"))
+            if response is not None and response.status_code == 200:
+                status = response.json()["status"]
+                if status in ("completed", "failed"):
+                    break
+            await asyncio.sleep(args.poll_interval)
+
+        if status == "completed":
+            stats.completed += 1
+            await stats.timed("results", client.get(f"/api/results/{survey_id}"))
+        elif status == "failed":
+            stats.failed += 1
+        else:
+            stats.timed_out += 1
+
+
+async def run_load_test(args):
+    stats = Stats()
+    # Draw every form up front so encoding does not inflate measured latency
+    forms = [
+        [create_survey_form(rng) for _ in range(args.forms)]
+        for rng in (random.Random(args.seed + i) for i in range(args.clients))
+    ]
+    limits = httpx.Limits(max_connections=args.clients)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(client, stats, client_forms, args)
+            for client_forms in forms
+        ))
+        elapsed = time.perf_counter() - start
+    return stats, elapsed
+
+
+def print_report(stats, elapsed):
+    total_requests = sum(stats.requests.values())
+    total_errors = sum(stats.errors.values())
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"Requests: {total_requests} ({total_requests / elapsed:.1f} req/s), errors: {total_errors}")
+    print(f"Pages completed: {stats.completed} ({stats.completed / elapsed * 60:.1f}/min), "
+          f"failed: {stats.failed}, timed out: {stats.timed_out}")
+    print(f"{'endpoint':<10}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for endpoint in ("upload", "status", "results"):
+        if not stats.requests[endpoint]:
+            continue
+        values = stats.latencies[endpoint]
+        if values:
+            latencies = "".join(f"{percentile(values, p) * 1000:>10.1f}" for p in (50, 95, 99))
+        else:
+            latencies = "".join(f"{'-':>10}" for _ in range(3))
+        print(f"{endpoint:<10}{stats.requests[endpoint]:>10}{stats.errors[endpoint]:>8}{latencies}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Survey OCR API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of a running API")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent simulated clients")
+    parser.add_argument("--forms", type=int, default=3, help="Forms uploaded by each client")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds between status polls")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for one survey")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic forms")
+    parser.add_argument("--serve", action="store_true", help="Start the API in-process")
+    parser.add_argument("--app-dir", default=".", help="Directory importable as the app package root (with --serve)")
+    parser.add_argument("--data-dir", help="Keep the served app's database and files here (default: temporary)")
+    parser.add_argument("--fake-ocr", action="store_true", help="Stub Tesseract (requires --serve)")
+    args = parser.parse_args()
+
+    if args.fake_ocr and not args.serve:
+        parser.error("--fake-ocr requires --serve")
+
+    server = thread = temp_dir = None
+    if args.serve:
+        data_dir = args.data_dir
+        if data_dir is None:
+            temp_dir = tempfile.TemporaryDirectory(prefix="survey_ocr_load_")
+            data_dir = temp_dir.name
+        url = httpx.URL(args.url)
+        server, thread = start_server(url.host, url.port or 8000, args.fake_ocr, args.app_dir, data_dir)
+
+    try:
+        stats, elapsed = asyncio.run(run_load_test(args))
+    finally:
+        if server is not None:
+            # Let the app's shutdown handlers run before the interpreter exits
+            server.should_exit = True
+            thread.join(timeout=30)
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print_report(stats, elapsed)
+
+
+if __name__ == "__main__":
+    main()